@@ -10,7 +10,11 @@ import typer
 import uvicorn
 from rich.console import Console
 
-from docling_serve.settings import docling_serve_settings, uvicorn_settings
+from docling_serve.settings import (
+    AsyncEngine,
+    docling_serve_settings,
+    uvicorn_settings,
+)
 
 warnings.filterwarnings(action="ignore", category=UserWarning, module="pydantic|torch")
 warnings.filterwarnings(action="ignore", category=FutureWarning, module="easyocr")
@@ -97,9 +101,8 @@ def _run(
 
     console.print(f"Starting {server_type} server 🚀")
 
-    run_subprocess = (
-        uvicorn_settings.workers is not None and uvicorn_settings.workers > 1
-    ) or uvicorn_settings.reload
+    multi_worker = uvicorn_settings.workers is not None and uvicorn_settings.workers > 1
+    run_subprocess = multi_worker or uvicorn_settings.reload
 
     run_ssl = (
         uvicorn_settings.ssl_certfile is not None
@@ -120,6 +123,13 @@ def _run(
             "using the environment variable [bold]DOCLING_SERVE_ENABLE_UI[/bold].[/yellow]"
         )
 
+    if multi_worker and docling_serve_settings.eng_kind == AsyncEngine.LOCAL:
+        err_console.print(
+            "\n[yellow]:warning: The local engine keeps tasks in the memory of each worker \n"
+            "process, so status and result requests may land on a worker which does not \n"
+            "know the task. Use a single worker, or the [bold]rq[/bold] engine to scale out.[/yellow]"
+        )
+
     # Propagate the settings to the app settings
     docling_serve_settings.artifacts_path = artifacts_path
     docling_serve_settings.enable_ui = enable_ui
@@ -160,6 +170,11 @@ def _run(
         root_path=uvicorn_settings.root_path,
         proxy_headers=uvicorn_settings.proxy_headers,
         timeout_keep_alive=uvicorn_settings.timeout_keep_alive,
+        loop=uvicorn_settings.loop,
+        http=uvicorn_settings.http,
+        backlog=uvicorn_settings.backlog,
+        limit_concurrency=uvicorn_settings.limit_concurrency,
+        timeout_graceful_shutdown=uvicorn_settings.timeout_graceful_shutdown,
         ssl_certfile=uvicorn_settings.ssl_certfile,
         ssl_keyfile=uvicorn_settings.ssl_keyfile,
         ssl_keyfile_password=uvicorn_settings.ssl_keyfile_password,
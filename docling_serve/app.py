@@ -29,6 +29,7 @@ from fastapi import (
 )
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.docs import (
     get_redoc_html,
     get_swagger_ui_html,
@@ -38,6 +39,8 @@ from fastapi.responses import JSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import create_model
 from scalar_fastapi import get_scalar_api_reference
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from docling.datamodel.base_models import DocumentStream
 from docling.datamodel.service.callbacks import (
@@ -151,6 +154,18 @@ setup_logging(
 
 _log = logging.getLogger(__name__)
 
+# Size of the chunks read from uploaded files into the in-memory stream.
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Response media types which are already compressed and must not be gzipped again.
+_PRECOMPRESSED_CONTENT_TYPES = ("application/zip",)
+
+# Constant bodies of the health and clear endpoints, shared across requests.
+_HEALTH_OK = HealthCheckResponse()
+_READY_OK = ReadinessResponse()
+_CLEAR_OK = ClearResponse()
+_PROGRESS_ACK = ProgressCallbackResponse(status="ack")
+
 # Tracks whether warm_up_caches() has completed.  Meaningful only for the
 # LocalOrchestrator (which eagerly loads ML models); the RQ orchestrator's
 # implementation is a no-op so this event fires instantly in RQ deployments.
@@ -163,6 +178,10 @@ _models_ready = asyncio.Event()
 # detect.
 _queue_processor_failed = asyncio.Event()
 
+# Set if the background model warm-up raised. Liveness then fails so the pod is
+# restarted, as it would have been when warm-up still ran before startup.
+_models_failed = asyncio.Event()
+
 
 def _supervise_queue_processor(task: asyncio.Task, failed_event: asyncio.Event) -> None:
     """Mark the orchestrator loop unhealthy only if it died with an exception.
@@ -182,6 +201,84 @@ def _supervise_queue_processor(task: asyncio.Task, failed_event: asyncio.Event)
     failed_event.set()
 
 
+async def _warm_up_models(orchestrator: BaseOrchestrator) -> None:
+    """Warm up the orchestrator caches, then mark the models as ready.
+
+    ``warm_up_caches()`` loads models synchronously inside a coroutine, so it is
+    run on its own event loop in a worker thread to keep the server's loop free
+    to answer probes while models load.
+    """
+    try:
+        await asyncio.to_thread(asyncio.run, orchestrator.warm_up_caches())
+    except Exception as exc:
+        _log.error("Model warm-up failed: %s", exc, exc_info=exc)
+        _models_failed.set()
+        return
+    _models_ready.set()
+    _log.info("Model warm-up completed")
+
+
+async def _task_status_with_wait(
+    orchestrator: BaseOrchestrator, task_id: str, wait: float
+) -> Task:
+    """Return the task status, long-polling up to ``wait`` seconds.
+
+    Not every orchestrator honors ``wait`` in ``task_status()``, so keep polling
+    here until the task completes or the wait expires. The wait is capped at
+    ``max_sync_wait``.
+    """
+    wait = min(wait, docling_serve_settings.max_sync_wait)
+    deadline = time.monotonic() + wait
+    task = await orchestrator.task_status(task_id=task_id, wait=wait)
+    while not task.is_completed():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(docling_serve_settings.sync_poll_interval, remaining))
+        task = await orchestrator.task_status(task_id=task_id)
+    return task
+
+
+class _GZipMiddleware:
+    """GZipMiddleware that leaves already-compressed downloads untouched.
+
+    Starlette only skips media types other than ``text/event-stream`` from 1.5.0
+    on, so responses with one of ``_PRECOMPRESSED_CONTENT_TYPES`` are routed past
+    the compressor here instead.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, compresslevel: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def route_response(scope: Scope, receive: Receive, gzip_send: Send):
+            passthrough = False
+
+            async def route(message: Message) -> None:
+                nonlocal passthrough
+                if message["type"] == "http.response.start":
+                    content_type = Headers(raw=message["headers"]).get(
+                        "content-type", ""
+                    )
+                    passthrough = content_type.startswith(_PRECOMPRESSED_CONTENT_TYPES)
+                await (send if passthrough else gzip_send)(message)
+
+            await self.app(scope, receive, route)
+
+        gzip = GZipMiddleware(
+            route_response,
+            minimum_size=self.minimum_size,
+            compresslevel=self.compresslevel,
+        )
+        await gzip(scope, receive, send)
+
+
 # Context manager to initialize and clean up the lifespan of the FastAPI app
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -192,11 +289,17 @@ async def lifespan(app: FastAPI):
     orchestrator.bind_notifier(notifier)
 
     # Warm up processing cache (loads ML models for LocalOrchestrator;
-    # no-op for RQOrchestrator since models live in the worker pods).
+    # no-op for RQOrchestrator since models live in the worker pods). This runs
+    # in the background so the server starts answering liveness probes right
+    # away; /ready keeps returning 503 until the models are loaded. Both events
+    # are module-level, so they are reset for this app instance first.
+    _models_ready.clear()
+    _models_failed.clear()
+    warm_up_task = None
     if docling_serve_settings.load_models_at_boot:
-        await orchestrator.warm_up_caches()
-
-    _models_ready.set()
+        warm_up_task = asyncio.create_task(_warm_up_models(orchestrator))
+    else:
+        _models_ready.set()
 
     # Start the background queue processor. If a supervised loop (RQ/Ray pub/sub
     # listener, Local workers) ever crashes, the done-callback flags the pod
@@ -212,6 +315,14 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    # The warm-up is not cancelled or awaited: the load runs in a worker thread,
+    # which cannot be interrupted. The event loop joins that thread when it
+    # closes, so the process exits only after the load has finished.
+    if warm_up_task and not warm_up_task.done():
+        _log.info(
+            "Model warm-up still running; the process exits once it has finished."
+        )
+
     # Cancel the background queue processor on shutdown
     queue_task.cancel()
     if reaper_task:
@@ -358,6 +469,15 @@ def create_app():  # noqa: C901
         ray_redis_manager=ray_redis_manager,
     )
 
+    # Compress innermost: BaseHTTPMiddleware layers re-stream the body, which
+    # would otherwise hide its size from the minimum_size check.
+    if docling_serve_settings.gzip_min_size is not None:
+        app.add_middleware(
+            _GZipMiddleware,
+            minimum_size=docling_serve_settings.gzip_min_size,
+            compresslevel=docling_serve_settings.gzip_compress_level,
+        )
+
     # Add log context middleware to extract request headers
     from docling_serve.logging_config import LogContextMiddleware
 
@@ -373,7 +493,7 @@ def create_app():  # noqa: C901
     app.add_middleware(
         CORSMiddleware,
         allow_origins=origins,
-        allow_credentials=True,
+        allow_credentials=docling_serve_settings.cors_allow_credentials,
         allow_methods=methods,
         allow_headers=headers,
     )
@@ -523,7 +643,8 @@ def create_app():  # noqa: C901
         if tenant_id:
             task_metadata["tenant_id"] = tenant_id
             _log.info(
-                f"[TENANT_ID] Preparing to enqueue with tenant_id='{tenant_id}' in metadata"
+                "[TENANT_ID] Preparing to enqueue with tenant_id='%s' in metadata",
+                tenant_id,
             )
         else:
             _log.warning("[TENANT_ID] No tenant_id provided, will use default")
@@ -540,7 +661,9 @@ def create_app():  # noqa: C901
         )
 
         _log.info(
-            f"[TENANT_ID] Task {task.task_id} created with tenant_id='{tenant_id or 'default'}'"
+            "[TENANT_ID] Task %s created with tenant_id='%s'",
+            task.task_id,
+            tenant_id or "default",
         )
 
         return task
@@ -557,23 +680,38 @@ def create_app():  # noqa: C901
         tenant_id: str | None = None,
     ) -> Task:
         _log.info(
-            f"[TENANT_ID] _enqueue_file called with tenant_id='{tenant_id}', "
-            f"processing {len(files)} files"
+            "[TENANT_ID] _enqueue_file called with tenant_id='%s', processing %d files",
+            tenant_id,
+            len(files),
         )
 
         # Load the uploaded files to Docling DocumentStream
         file_sources: list[TaskSource] = []
         for i, file in enumerate(files):
-            file_bytes = file.file.read()
-            buf = BytesIO(file_bytes)
+            # Read the upload with UploadFile.read(), which offloads reads of
+            # disk-spooled uploads to the threadpool, in chunks so the loop gets
+            # control back between them. The md5 is updated per chunk instead
+            # of hashing the whole file in one blocking call. Peak memory stays
+            # about one copy of the file, as with a single read.
+            buf = BytesIO()
+            digest = hashlib.md5(usedforsecurity=False)
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                buf.write(chunk)
+                digest.update(chunk)
+            size = buf.tell()
+            buf.seek(0)
             suffix = "" if len(file_sources) == 1 else f"_{i}"
             name = file.filename if file.filename else f"file{suffix}.pdf"
 
             # Log file details for debugging transmission issues
-            file_hash = hashlib.md5(file_bytes, usedforsecurity=False).hexdigest()[:12]
+            file_hash = digest.hexdigest()[:12]
             _log.info(
-                f"File {i}: name={name}, size={len(file_bytes)} bytes, "
-                f"md5={file_hash}, content_type={file.content_type}"
+                "File %d: name=%s, size=%d bytes, md5=%s, content_type=%s",
+                i,
+                name,
+                size,
+                file_hash,
+                file.content_type,
             )
 
             file_sources.append(DocumentStream(name=name, stream=buf))
@@ -595,7 +733,9 @@ def create_app():  # noqa: C901
         )
 
         _log.info(
-            f"[TENANT_ID] File task {task.task_id} created with tenant_id='{tenant_id or 'default'}'"
+            "[TENANT_ID] File task %s created with tenant_id='%s'",
+            task.task_id,
+            tenant_id or "default",
         )
 
         return task
@@ -604,8 +744,9 @@ def create_app():  # noqa: C901
         """Extract tenant_id from header or return default."""
         tenant_id = tenant_id_header or "default"
         _log.info(
-            f"[TENANT_ID] Extracted tenant_id from header: '{tenant_id}' "
-            f"(header_value: '{tenant_id_header}')"
+            "[TENANT_ID] Extracted tenant_id from header: '%s' (header_value: '%s')",
+            tenant_id,
+            tenant_id_header,
         )
         return tenant_id
 
@@ -625,8 +766,10 @@ def create_app():  # noqa: C901
         owner_tenant_id = _task_tenant_id(task)
         if owner_tenant_id != tenant_id:
             _log.warning(
-                f"[TENANT_ID] Tenant mismatch for task {task.task_id}: "
-                f"caller='{tenant_id}' owner='{owner_tenant_id}' - denying access"
+                "[TENANT_ID] Tenant mismatch for task %s: caller='%s' owner='%s' - denying access",
+                task.task_id,
+                tenant_id,
+                owner_tenant_id,
             )
             raise TaskNotFoundError()
 
@@ -664,7 +807,6 @@ def create_app():  # noqa: C901
                     request.convert_options, service_policy
                 )
             },
-            deep=True,
         )
         validate_chunk_request(normalized_request, service_policy)
         return normalized_request
@@ -795,11 +937,16 @@ def create_app():  # noqa: C901
     def health() -> HealthCheckResponse:
         _log.info("Health check requested")
         _log.debug("Processing health check")
-        return HealthCheckResponse()
+        return _HEALTH_OK
 
     @app.get("/ready", tags=["health"])
     async def readiness() -> ReadinessResponse:
         # Gate on model loading (LocalOrchestrator only; instant for RQ).
+        if _models_failed.is_set():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Model warm-up failed.",
+            )
         if not _models_ready.is_set():
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -814,7 +961,12 @@ def create_app():  # noqa: C901
 
         orchestrator = get_async_orchestrator()
         try:
-            await orchestrator.check_connection()
+            if isinstance(orchestrator, RQOrchestrator):
+                # The RQ engine pings Redis with its synchronous client, which
+                # would block the event loop for up to the socket timeout.
+                await asyncio.to_thread(asyncio.run, orchestrator.check_connection())
+            else:
+                await orchestrator.check_connection()
         except Exception as exc:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -825,7 +977,7 @@ def create_app():  # noqa: C901
                 ),
             ) from exc
 
-        return ReadinessResponse()
+        return _READY_OK
 
     @app.get("/readyz", tags=["health"], include_in_schema=False)
     async def readyz() -> ReadinessResponse:
@@ -840,12 +992,17 @@ def create_app():  # noqa: C901
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Background queue processor is not running.",
             )
-        return HealthCheckResponse()
+        if _models_failed.is_set():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Model warm-up failed.",
+            )
+        return _HEALTH_OK
 
     # API readiness compatibility for OpenShift AI Workbench
     @app.get("/api", include_in_schema=False)
     def api_check() -> HealthCheckResponse:
-        return HealthCheckResponse()
+        return _HEALTH_OK
 
     # Docling versions
     @app.get("/version", tags=["health"])
@@ -892,7 +1049,7 @@ def create_app():  # noqa: C901
     ):
         prepared_request = _prepare_convert_request(conversion_request)
         tenant_id = _get_tenant_id_from_header(x_tenant_id)
-        _log.info(f"[TENANT_ID] process_url endpoint received tenant_id='{tenant_id}'")
+        _log.info("[TENANT_ID] process_url endpoint received tenant_id='%s'", tenant_id)
         task = await _enqueue_source(
             orchestrator=orchestrator, request=prepared_request, tenant_id=tenant_id
         )
@@ -962,7 +1119,9 @@ def create_app():  # noqa: C901
         options = _prepare_convert_options(options)
         _validate_multipart_target_type(target_type)
         tenant_id = _get_tenant_id_from_header(x_tenant_id)
-        _log.info(f"[TENANT_ID] process_file endpoint received tenant_id='{tenant_id}'")
+        _log.info(
+            "[TENANT_ID] process_file endpoint received tenant_id='%s'", tenant_id
+        )
         target = _resolve_file_target(target_type)
         callbacks = [parse_callback_item(v) for v in callbacks_raw]
         task = await _enqueue_file(
@@ -1018,7 +1177,7 @@ def create_app():  # noqa: C901
         prepared_request = _prepare_convert_request(conversion_request)
         tenant_id = _get_tenant_id_from_header(x_tenant_id)
         _log.info(
-            f"[TENANT_ID] process_url_async endpoint received tenant_id='{tenant_id}'"
+            "[TENANT_ID] process_url_async endpoint received tenant_id='%s'", tenant_id
         )
         task = await _enqueue_source(
             orchestrator=orchestrator, request=prepared_request, tenant_id=tenant_id
@@ -1052,7 +1211,8 @@ def create_app():  # noqa: C901
         conversion_request = _prepare_batch_convert_request(conversion_request)
         tenant_id = _get_tenant_id_from_header(x_tenant_id)
         _log.info(
-            f"[TENANT_ID] process_source_batch endpoint received tenant_id='{tenant_id}'"
+            "[TENANT_ID] process_source_batch endpoint received tenant_id='%s'",
+            tenant_id,
         )
         task = await _enqueue_source(
             orchestrator=orchestrator,
@@ -1107,7 +1267,7 @@ def create_app():  # noqa: C901
         _validate_multipart_target_type(target_type)
         tenant_id = _get_tenant_id_from_header(x_tenant_id)
         _log.info(
-            f"[TENANT_ID] process_file_async endpoint received tenant_id='{tenant_id}'"
+            "[TENANT_ID] process_file_async endpoint received tenant_id='%s'", tenant_id
         )
         target = _resolve_file_target(target_type)
         callbacks = [parse_callback_item(v) for v in callbacks_raw]
@@ -1161,7 +1321,9 @@ def create_app():  # noqa: C901
             request = _prepare_chunk_request(request)
             tenant_id = _get_tenant_id_from_header(x_tenant_id)
             _log.info(
-                f"[TENANT_ID] chunk_source_async ({path_name}) endpoint received tenant_id='{tenant_id}'"
+                "[TENANT_ID] chunk_source_async (%s) endpoint received tenant_id='%s'",
+                path_name,
+                tenant_id,
             )
             task = await _enqueue_source(
                 orchestrator=orchestrator, request=request, tenant_id=tenant_id
@@ -1232,7 +1394,9 @@ def create_app():  # noqa: C901
             _validate_multipart_target_type(target_type)
             tenant_id = _get_tenant_id_from_header(x_tenant_id)
             _log.info(
-                f"[TENANT_ID] chunk_file_async ({path_name}) endpoint received tenant_id='{tenant_id}'"
+                "[TENANT_ID] chunk_file_async (%s) endpoint received tenant_id='%s'",
+                path_name,
+                tenant_id,
             )
             target = InBodyTarget() if target_type == TargetName.INBODY else ZipTarget()
             task = await _enqueue_file(
@@ -1286,7 +1450,9 @@ def create_app():  # noqa: C901
             request = _prepare_chunk_request(request)
             tenant_id = _get_tenant_id_from_header(x_tenant_id)
             _log.info(
-                f"[TENANT_ID] chunk_source ({path_name}) endpoint received tenant_id='{tenant_id}'"
+                "[TENANT_ID] chunk_source (%s) endpoint received tenant_id='%s'",
+                path_name,
+                tenant_id,
             )
             task = await _enqueue_source(
                 orchestrator=orchestrator, request=request, tenant_id=tenant_id
@@ -1374,7 +1540,9 @@ def create_app():  # noqa: C901
             _validate_multipart_target_type(target_type)
             tenant_id = _get_tenant_id_from_header(x_tenant_id)
             _log.info(
-                f"[TENANT_ID] chunk_file ({path_name}) endpoint received tenant_id='{tenant_id}'"
+                "[TENANT_ID] chunk_file (%s) endpoint received tenant_id='%s'",
+                path_name,
+                tenant_id,
             )
             target = InBodyTarget() if target_type == TargetName.INBODY else ZipTarget()
             task = await _enqueue_file(
@@ -1430,12 +1598,21 @@ def create_app():  # noqa: C901
         ] = None,
         wait: Annotated[
             float,
-            Query(description="Number of seconds to wait for a completed status."),
+            Query(
+                ge=0,
+                allow_inf_nan=False,
+                description=(
+                    "Number of seconds to wait for a completed status. Capped at "
+                    "DOCLING_SERVE_MAX_SYNC_WAIT."
+                ),
+            ),
         ] = 0.0,
     ):
         tenant_id = _get_tenant_id_from_header(x_tenant_id)
         try:
-            task = await orchestrator.task_status(task_id=task_id, wait=wait)
+            task = await _task_status_with_wait(
+                orchestrator=orchestrator, task_id=task_id, wait=wait
+            )
             _assert_task_tenant(task, tenant_id)
             task_queue_position = await orchestrator.get_queue_position(task_id=task_id)
         except TaskNotFoundError:
@@ -1465,7 +1642,7 @@ def create_app():  # noqa: C901
             # WebSocket clients on this endpoint authenticate via query
             # parameter. Note that query-parameter keys may be captured in
             # proxy/access logs.
-            if api_key != docling_serve_settings.api_key:
+            if not require_auth.is_valid_key(api_key):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail=(
@@ -1545,7 +1722,7 @@ def create_app():  # noqa: C901
                     return
                 # each client message will be interpreted as a request for update
                 msg = await websocket.receive_text()
-                _log.debug(f"Received message: {msg}")
+                _log.debug("Received message: %s", msg)
 
         except TaskNotFoundError:
             # Task was removed (e.g. reaped) while streaming; close gracefully.
@@ -1565,7 +1742,7 @@ def create_app():  # noqa: C901
             except Exception:
                 pass
         except WebSocketDisconnect:
-            _log.info(f"WebSocket disconnected for job {task_id}")
+            _log.info("WebSocket disconnected for job %s", task_id)
 
         finally:
             subs = orchestrator.notifier.task_subscribers.get(task_id)
@@ -1636,7 +1813,7 @@ def create_app():  # noqa: C901
     ):
         try:
             await orchestrator.receive_task_progress(request=request)
-            return ProgressCallbackResponse(status="ack")
+            return _PROGRESS_ACK
         except TaskNotFoundError:
             raise HTTPException(status_code=404, detail="Task not found.")
         except ProgressInvalid as err:
@@ -1662,7 +1839,7 @@ def create_app():  # noqa: C901
         orchestrator: Annotated[BaseOrchestrator, Depends(get_async_orchestrator)],
     ):
         await orchestrator.clear_converters()
-        return ClearResponse()
+        return _CLEAR_OK
 
     # Clean results
     @app.get(
@@ -1676,7 +1853,7 @@ def create_app():  # noqa: C901
         older_then: float = 3600,
     ):
         await orchestrator.clear_results(older_than=older_then)
-        return ClearResponse()
+        return _CLEAR_OK
 
     @app.get("/v1/memory/stats", tags=["management"])
     async def memory_stats():
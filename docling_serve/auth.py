@@ -1,3 +1,4 @@
+import hmac
 from typing import Any
 
 from fastapi import HTTPException, Request, status
@@ -23,9 +24,16 @@ class APIKeyAuth(APIKeyHeader):
         fail_on_unauthorized: bool = True,
     ) -> None:
         self.api_key = api_key
+        self._api_key_bytes = api_key.encode()
         self.header_name = header_name
         super().__init__(name=self.header_name, auto_error=False)
 
+    def is_valid_key(self, api_key: str) -> bool:
+        """Check a provided key against the configured one in constant time."""
+        if self.api_key == "":
+            return True
+        return hmac.compare_digest(api_key.encode(), self._api_key_bytes)
+
     async def _validate_api_key(self, header_api_key: str | None):
         if header_api_key is None:
             return AuthenticationResult(
@@ -35,7 +43,7 @@ class APIKeyAuth(APIKeyHeader):
         header_api_key = header_api_key.strip()
 
         # Otherwise check the apikey
-        if header_api_key == self.api_key or self.api_key == "":
+        if self.is_valid_key(header_api_key):
             return AuthenticationResult(
                 valid=True,
                 detail=header_api_key,
@@ -247,22 +247,24 @@ def change_ocr_lang(ocr_engine):
 
 
 def wait_task_finish(auth: str, task_id: str, return_as_file: bool):
-    conversion_sucess = False
-    task_finished = False
-    task_status = ""
-
     headers = {}
     if docling_serve_settings.api_key:
         headers["X-Api-Key"] = str(auth)
 
-    ssl_ctx = get_ssl_context()
+    # One client (and connection pool) for all status polls and result fetches
+    with httpx.Client(headers=headers, verify=get_ssl_context(), timeout=15) as client:
+        return _wait_task_finish(client, task_id, return_as_file)
+
+
+def _wait_task_finish(client: httpx.Client, task_id: str, return_as_file: bool):
+    conversion_sucess = False
+    task_finished = False
+    task_status = ""
+
     while not task_finished:
         try:
-            response = httpx.get(
-                f"{get_api_endpoint()}/v1/status/poll/{task_id}?wait=5",
-                headers=headers,
-                verify=ssl_ctx,
-                timeout=15,
+            response = client.get(
+                f"{get_api_endpoint()}/v1/status/poll/{task_id}?wait=5"
             )
 
             # Check response status code first
@@ -292,7 +294,10 @@ def wait_task_finish(auth: str, task_id: str, return_as_file: bool):
                 conversion_sucess = False
                 task_finished = True
                 raise RuntimeError(f"Task failed with status {task_status!r}")
-            time.sleep(5)
+            if not task_finished:
+                # The server holds the request for up to ``wait`` seconds, but
+                # answers sooner if DOCLING_SERVE_MAX_SYNC_WAIT is smaller.
+                time.sleep(1)
         except Exception as e:
             logger.error(f"Error processing file(s): {e}")
             conversion_sucess = False
@@ -306,12 +311,7 @@ def wait_task_finish(auth: str, task_id: str, return_as_file: bool):
 
         while retry_count < max_retries:
             try:
-                response = httpx.get(
-                    f"{get_api_endpoint()}/v1/result/{task_id}",
-                    headers=headers,
-                    timeout=15,
-                    verify=ssl_ctx,
-                )
+                response = client.get(f"{get_api_endpoint()}/v1/result/{task_id}")
 
                 if response.status_code == 404:
                     retry_count += 1
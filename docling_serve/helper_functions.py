@@ -4,7 +4,8 @@ import json
 import platform
 import re
 import sys
-from typing import Union, get_args, get_origin
+from collections.abc import Callable
+from typing import Any, Union, get_args, get_origin
 
 from fastapi import Depends, Form
 from pydantic import AnyUrl, BaseModel, TypeAdapter, ValidationError
@@ -65,12 +66,15 @@ def FormDepends(
     cls: type[BaseModel], prefix: str = "", excluded_fields: list[str] = []
 ):
     new_parameters = []
+    # Per-field parse plan, resolved once here instead of on every request:
+    # (field name, form parameter name, parser for JSON-encoded values or None)
+    form_fields: list[tuple[str, str, Callable[[str], Any] | None]] = []
 
     for field_name, model_field in cls.model_fields.items():
         if field_name in excluded_fields:
             continue
 
-        annotation = model_field.annotation
+        annotation: Any = model_field.annotation
         description = model_field.description
         default = (
             Form(..., description=description, examples=model_field.examples)
@@ -83,7 +87,9 @@ def FormDepends(
         )
 
         # Flatten nested Pydantic models and dict/list fields by accepting them as JSON strings
+        parser: Callable[[str], Any] | None = None
         if is_pydantic_model(annotation):
+            parser = TypeAdapter(annotation).validate_json
             annotation = str
             default = Form(
                 None
@@ -98,6 +104,7 @@ def FormDepends(
                 ],
             )
         elif is_json_field(annotation):
+            parser = json.loads
             annotation = str
             default = Form(
                 None
@@ -109,6 +116,7 @@ def FormDepends(
                 else [json.dumps(ex) for ex in model_field.examples],
             )
 
+        form_fields.append((field_name, f"{prefix}{field_name}", parser))
         new_parameters.append(
             inspect.Parameter(
                 name=f"{prefix}{field_name}",
@@ -120,25 +128,15 @@ def FormDepends(
 
     async def as_form_func(**data):
         newdata = {}
-        for field_name, model_field in cls.model_fields.items():
-            if field_name in excluded_fields:
-                continue
-            value = data.get(f"{prefix}{field_name}")
-            newdata[field_name] = value
-            annotation = model_field.annotation
-
+        for field_name, param_name, parser in form_fields:
+            value = data.get(param_name)
             # Parse nested models and dict/list fields from JSON string
-            if value is not None and is_pydantic_model(annotation):
-                try:
-                    validator = TypeAdapter(annotation)
-                    newdata[field_name] = validator.validate_json(value)
-                except Exception as e:
-                    raise ValueError(f"Invalid JSON for field '{field_name}': {e}")
-            elif value is not None and is_json_field(annotation):
+            if value is not None and parser is not None:
                 try:
-                    newdata[field_name] = json.loads(value)
+                    value = parser(value)
                 except Exception as e:
                     raise ValueError(f"Invalid JSON for field '{field_name}': {e}")
+            newdata[field_name] = value
 
         return cls(**newdata)
 
@@ -172,12 +170,13 @@ def parse_callback_item(value: str):
         return CallbackSpec(url=AnyUrl(value))
 
 
+_LIST_SEPARATOR_RE = re.compile(r"[;,]")
+_TRUE_STRINGS = frozenset(("true", "1", "yes"))
+
+
 def _to_list_of_strings(input_value: Union[str, list[str]]) -> list[str]:
     def split_and_strip(value: str) -> list[str]:
-        if re.search(r"[;,]", value):
-            return [item.strip() for item in re.split(r"[;,]", value)]
-        else:
-            return [value.strip()]
+        return [item.strip() for item in _LIST_SEPARATOR_RE.split(value)]
 
     if isinstance(input_value, str):
         return split_and_strip(input_value)
@@ -196,5 +195,5 @@ def _str_to_bool(value: Union[str, bool]) -> bool:
         return value  # Already a boolean, return as-is
     if isinstance(value, str):
         value = value.strip().lower()  # Normalize input
-        return value in ("true", "1", "yes")
+        return value in _TRUE_STRINGS
     return False  # Default to False if none of the above matches
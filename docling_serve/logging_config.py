@@ -33,7 +33,13 @@ class ColoredLogFormatter(logging.Formatter):
     }
     RESET_CODE = "\033[0m"
 
+    def __init__(self, *args: Any, use_color: bool = True, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.use_color = use_color
+
     def format(self, record: logging.LogRecord) -> str:
+        if not self.use_color:
+            return super().format(record)
         color = self.COLOR_CODES.get(record.levelno, "")
         record.levelname = f"{color}{record.levelname}{self.RESET_CODE}"
         return super().format(record)
@@ -196,9 +202,12 @@ def setup_logging(
     if log_format.lower() == "json":
         formatter = JSONLogFormatter()
     else:
+        # Only emit ANSI colors on an interactive terminal, not in container
+        # or file logs.
         formatter = ColoredLogFormatter(
             "%(levelname)s:\t%(asctime)s - %(name)s - %(message)s",
             datefmt="%H:%M:%S",
+            use_color=handler.stream.isatty(),
         )
 
     handler.setFormatter(formatter)
@@ -336,7 +336,7 @@ def normalize_convert_options(
 
     if not updates:
         return options
-    return options.model_copy(update=updates, deep=True)
+    return options.model_copy(update=updates)
 
 
 def normalize_request(
@@ -344,7 +344,6 @@ def normalize_request(
 ) -> _ConvertRequestT:
     return request.model_copy(
         update={"options": normalize_convert_options(request.options, policy)},
-        deep=True,
     )
 
 
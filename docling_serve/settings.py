@@ -38,6 +38,12 @@ class UvicornSettings(BaseSettings):
     ssl_keyfile: Optional[Path] = None
     ssl_keyfile_password: Optional[str] = None
     workers: Union[int, None] = None
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard])
+    loop: str = "auto"
+    http: str = "auto"
+    backlog: int = 2048
+    limit_concurrency: Optional[int] = None
+    timeout_graceful_shutdown: Optional[int] = None
 
 
 class LogLevel(str, enum.Enum):
@@ -175,6 +181,11 @@ class DoclingServeSettings(BaseSettings):
     cors_origins: list[str] = ["*"]
     cors_methods: list[str] = ["*"]
     cors_headers: list[str] = ["*"]
+    cors_allow_credentials: bool = True
+
+    # Gzip-compress responses of at least this many bytes; None disables it.
+    gzip_min_size: Optional[int] = 1024
+    gzip_compress_level: int = Field(5, ge=1, le=9)
 
     eng_kind: AsyncEngine = AsyncEngine.LOCAL
     result_removal_delay: int = 300  # seconds until result is removed after fetch
@@ -7,6 +7,7 @@ from docling.datamodel.service.responses import (
     TaskStatusResponse,
     WebsocketMessage,
 )
+from docling_jobkit.datamodel.task import Task
 from docling_jobkit.datamodel.task_meta import TaskStatus
 from docling_jobkit.orchestrators.base_notifier import BaseNotifier
 from docling_jobkit.orchestrators.base_orchestrator import BaseOrchestrator
@@ -29,15 +30,24 @@ class WebsocketNotifier(BaseNotifier):
                 await websocket.close()
 
     async def notify_task_subscribers(self, task_id: str):
-        if task_id not in self.task_subscribers:
+        if not self.task_subscribers.get(task_id):
             _log.debug(
-                f"Task {task_id} has no websocket subscribers, skipping notification."
+                "Task %s has no websocket subscribers, skipping notification.", task_id
             )
             return
 
         try:
             # Get task status from Redis or RQ directly instead of in-memory registry
             task = await self.orchestrator.task_status(task_id=task_id)
+        except Exception as e:
+            _log.error("Error fetching status for task %s: %s", task_id, e)
+            return
+
+        await self._send_task_update(task)
+
+    async def _send_task_update(self, task: Task):
+        task_id = task.task_id
+        try:
             task_queue_position = await self.orchestrator.get_queue_position(task_id)
             msg = TaskStatusResponse(
                 task_id=task.task_id,
@@ -49,7 +59,7 @@ class WebsocketNotifier(BaseNotifier):
                 failure=task.failure,
             )
         except Exception as e:
-            _log.error(f"Error fetching status for task {task_id}: {e}")
+            _log.error("Error fetching queue position for task %s: %s", task_id, e)
             return
 
         payload = WebsocketMessage(
@@ -62,7 +72,9 @@ class WebsocketNotifier(BaseNotifier):
                     await websocket.close()
             except Exception as e:
                 _log.warning(
-                    f"Failed to notify subscriber for task {task_id}, discarding: {e}"
+                    "Failed to notify subscriber for task %s, discarding: %s",
+                    task_id,
+                    e,
                 )
                 subs = self.task_subscribers.get(task_id)
                 if subs:
@@ -70,15 +82,19 @@ class WebsocketNotifier(BaseNotifier):
 
     async def notify_queue_positions(self):
         """Notify all subscribers of pending tasks about queue position updates."""
-        for task_id in list(self.task_subscribers.keys()):
+        for task_id, subscribers in list(self.task_subscribers.items()):
+            if not subscribers:
+                continue
             try:
                 # Check task status directly from Redis or RQ
                 task = await self.orchestrator.task_status(task_id)
 
-                # Notify only pending tasks
+                # Notify only pending tasks, reusing the status fetched above
                 if task.task_status == TaskStatus.PENDING:
-                    await self.notify_task_subscribers(task_id)
+                    await self._send_task_update(task)
             except Exception as e:
                 _log.error(
-                    f"Error checking task {task_id} status for queue position notification: {e}"
+                    "Error checking task %s status for queue position notification: %s",
+                    task_id,
+                    e,
                 )
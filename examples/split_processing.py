@@ -1,5 +1,6 @@
 import json
 import time
+from io import BytesIO
 from pathlib import Path
 
 import httpx
@@ -13,6 +14,8 @@ path_to_pdf = Path("./tests/2206.01062v1.pdf")
 pages_per_file = 4
 base_url = "http://localhost:5001/v1"
 out_dir = Path("examples/splitted_pdf/")
+# Seconds the server may hold each status request open waiting for completion
+status_wait = 5.0
 
 
 class ConvertedSplittedPdf(BaseModel):
@@ -21,16 +24,20 @@ class ConvertedSplittedPdf(BaseModel):
     result: dict | None = None
 
 
-def get_task_result(task_id: str):
-    response = httpx.get(
+def get_task_result(client: httpx.Client, task_id: str):
+    response = client.get(
         f"{base_url}/result/{task_id}",
         timeout=15,
     )
     return response.json()
 
 
-def check_task_status(task_id: str):
-    response = httpx.get(f"{base_url}/status/poll/{task_id}", timeout=15)
+def check_task_status(client: httpx.Client, task_id: str):
+    response = client.get(
+        f"{base_url}/status/poll/{task_id}",
+        params={"wait": status_wait},
+        timeout=status_wait + 15,
+    )
     task = response.json()
     task_status = task["task_status"]
 
@@ -41,12 +48,16 @@ def check_task_status(task_id: str):
     if task_status in ("failure", "revoked"):
         raise RuntimeError("A conversion failed")
 
-    time.sleep(5)
-
     return task_finished
 
 
-def post_file(file_path: Path, start_page: int, end_page: int):
+def post_file(
+    client: httpx.Client,
+    file_path: Path,
+    file_bytes: bytes,
+    start_page: int,
+    end_page: int,
+):
     payload = {
         "to_formats": ["json"],
         "image_export_mode": "placeholder",
@@ -56,9 +67,9 @@ def post_file(file_path: Path, start_page: int, end_page: int):
     }
 
     files = {
-        "files": (file_path.name, file_path.open("rb"), "application/pdf"),
+        "files": (file_path.name, file_bytes, "application/pdf"),
     }
-    response = httpx.post(
+    response = client.post(
         f"{base_url}/convert/file/async",
         files=files,
         data=payload,
@@ -75,31 +86,41 @@ def main():
 
     splitted_pdfs: list[ConvertedSplittedPdf] = []
 
-    with open(filename, "rb") as input_pdf_file:
-        pdf_reader = PdfReader(input_pdf_file)
-        total_pages = len(pdf_reader.pages)
+    # Reuse one client (and its keep-alive connections) for all requests
+    with httpx.Client() as client:
+        # Read the PDF once and reuse the bytes for every page-range upload
+        file_bytes = filename.read_bytes()
+        total_pages = len(PdfReader(BytesIO(file_bytes)).pages)
 
         for start_page in range(0, total_pages, pages_per_file):
             task_id = post_file(
-                filename, start_page + 1, min(start_page + pages_per_file, total_pages)
+                client,
+                filename,
+                file_bytes,
+                start_page + 1,
+                min(start_page + pages_per_file, total_pages),
             )
             splitted_pdfs.append(ConvertedSplittedPdf(task_id=task_id))
 
-    all_files_converted = False
-    while not all_files_converted:
-        found_conversion_running = False
+        # The status endpoint long-polls (``wait``); the short pause per sweep
+        # only guards against a server with a smaller DOCLING_SERVE_MAX_SYNC_WAIT.
+        all_files_converted = False
+        while not all_files_converted:
+            found_conversion_running = False
+            for splitted_pdf in splitted_pdfs:
+                if not splitted_pdf.conversion_finished:
+                    found_conversion_running = True
+                    print("checking conversion status...")
+                    splitted_pdf.conversion_finished = check_task_status(
+                        client, splitted_pdf.task_id
+                    )
+            if not found_conversion_running:
+                all_files_converted = True
+            else:
+                time.sleep(1)
+
         for splitted_pdf in splitted_pdfs:
-            if not splitted_pdf.conversion_finished:
-                found_conversion_running = True
-                print("checking conversion status...")
-                splitted_pdf.conversion_finished = check_task_status(
-                    splitted_pdf.task_id
-                )
-        if not found_conversion_running:
-            all_files_converted = True
-
-    for splitted_pdf in splitted_pdfs:
-        splitted_pdf.result = get_task_result(splitted_pdf.task_id)
+            splitted_pdf.result = get_task_result(client, splitted_pdf.task_id)
 
     files = []
     for i, splitted_pdf in enumerate(splitted_pdfs):
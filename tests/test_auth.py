@@ -0,0 +1,56 @@
+"""Unit tests for the API key dependency."""
+
+import pytest
+from fastapi import HTTPException, Request
+
+from docling_serve.auth import APIKeyAuth
+
+
+def test_is_valid_key_matches_configured_key():
+    auth = APIKeyAuth("secret")
+
+    assert auth.is_valid_key("secret")
+    assert not auth.is_valid_key("secre")
+    assert not auth.is_valid_key("")
+
+
+def test_is_valid_key_accepts_anything_without_configured_key():
+    auth = APIKeyAuth("")
+
+    assert auth.is_valid_key("")
+    assert auth.is_valid_key("whatever")
+
+
+async def test_validate_api_key_strips_header_value():
+    auth = APIKeyAuth("secret")
+
+    result = await auth._validate_api_key("  secret ")
+    assert result.valid
+    assert result.detail == "secret"
+
+    result = await auth._validate_api_key("wrong")
+    assert not result.valid
+
+    result = await auth._validate_api_key(None)
+    assert not result.valid
+    assert result.errors == ["Missing header X-Api-Key."]
+
+
+def _request(headers: dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        }
+    )
+
+
+async def test_call_rejects_invalid_key():
+    auth = APIKeyAuth("secret")
+
+    result = await auth(_request({"X-Api-Key": "secret"}))
+    assert result.valid
+
+    with pytest.raises(HTTPException) as exc_info:
+        await auth(_request({"X-Api-Key": "wrong"}))
+    assert exc_info.value.status_code == 401
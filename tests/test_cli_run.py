@@ -0,0 +1,28 @@
+import uvicorn
+
+from docling_serve.__main__ import _run
+from docling_serve.settings import docling_serve_settings, uvicorn_settings
+
+
+def test_uvicorn_settings_are_passed_to_uvicorn(monkeypatch):
+    calls = []
+    monkeypatch.setattr(uvicorn, "run", lambda **kwargs: calls.append(kwargs))
+    monkeypatch.setattr(uvicorn_settings, "loop", "uvloop")
+    monkeypatch.setattr(uvicorn_settings, "http", "httptools")
+    monkeypatch.setattr(uvicorn_settings, "backlog", 512)
+    monkeypatch.setattr(uvicorn_settings, "limit_concurrency", 64)
+    monkeypatch.setattr(uvicorn_settings, "timeout_graceful_shutdown", 30)
+
+    _run(
+        command="run",
+        artifacts_path=docling_serve_settings.artifacts_path,
+        enable_ui=docling_serve_settings.enable_ui,
+    )
+
+    assert len(calls) == 1
+    kwargs = calls[0]
+    assert kwargs["loop"] == "uvloop"
+    assert kwargs["http"] == "httptools"
+    assert kwargs["backlog"] == 512
+    assert kwargs["limit_concurrency"] == 64
+    assert kwargs["timeout_graceful_shutdown"] == 30
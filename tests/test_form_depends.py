@@ -0,0 +1,45 @@
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from docling_serve.helper_functions import FormDepends
+
+
+class InnerOptions(BaseModel):
+    enabled: bool = False
+    level: int = 1
+
+
+class OuterOptions(BaseModel):
+    name: str = "default"
+    inner: InnerOptions = InnerOptions()
+    extra: dict[str, Any] = {}
+
+
+form_func = FormDepends(OuterOptions).dependency
+
+
+@pytest.mark.asyncio
+async def test_nested_model_field_is_parsed_from_json():
+    options = await form_func(
+        name="custom", inner='{"enabled": true, "level": 3}', extra="{}"
+    )
+
+    assert options.name == "custom"
+    assert options.inner == InnerOptions(enabled=True, level=3)
+
+
+@pytest.mark.asyncio
+async def test_dict_field_is_parsed_from_json():
+    options = await form_func(
+        name="custom", inner="{}", extra='{"key": "value", "count": 2}'
+    )
+
+    assert options.extra == {"key": "value", "count": 2}
+
+
+@pytest.mark.asyncio
+async def test_invalid_json_names_the_field():
+    with pytest.raises(ValueError, match="Invalid JSON for field 'extra'"):
+        await form_func(name="custom", inner="{}", extra="{not json")
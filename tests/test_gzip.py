@@ -0,0 +1,46 @@
+import os
+
+import pytest
+from fastapi import Response
+from fastapi.testclient import TestClient
+
+from docling_serve.app import create_app
+from docling_serve.settings import docling_serve_settings
+
+_ZIP_SIZE = 16 * 1024
+
+
+@pytest.fixture(scope="module")
+def client():
+    assert docling_serve_settings.gzip_min_size is not None
+    assert docling_serve_settings.gzip_min_size < _ZIP_SIZE
+    app = create_app()
+
+    @app.get("/test/zip")
+    def zip_download():
+        return Response(
+            content=os.urandom(_ZIP_SIZE),
+            media_type="application/zip",
+        )
+
+    return TestClient(app, headers={"Accept-Encoding": "gzip"})
+
+
+def test_small_response_is_not_compressed(client: TestClient):
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_large_json_response_is_compressed(client: TestClient):
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["paths"]
+
+
+def test_zip_download_is_not_recompressed(client: TestClient):
+    response = client.get("/test/zip")
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert len(response.content) == _ZIP_SIZE
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -6,10 +7,14 @@ import pytest_asyncio
 from asgi_lifespan import LifespanManager
 from httpx import ASGITransport, AsyncClient
 
+from docling_jobkit.orchestrators.rq.orchestrator import RQOrchestrator
+
 from docling_serve.app import (
+    _models_failed,
     _models_ready,
     _queue_processor_failed,
     _supervise_queue_processor,
+    _warm_up_models,
     create_app,
 )
 from docling_serve.datamodel.responses import (
@@ -117,6 +122,24 @@ async def test_readyz_exposes_raw_error_in_debug_mode(client: AsyncClient):
     assert response.json()["detail"] == "Ray dispatcher unavailable"
 
 
+@pytest.mark.asyncio
+async def test_ready_checks_rq_connection_off_the_event_loop(client: AsyncClient):
+    check_threads = []
+
+    async def check_connection():
+        check_threads.append(threading.current_thread())
+
+    orchestrator = MagicMock(spec=RQOrchestrator)
+    orchestrator.check_connection = check_connection
+
+    with patch("docling_serve.app.get_async_orchestrator", return_value=orchestrator):
+        response = await client.get("/ready")
+
+    assert response.status_code == 200
+    assert len(check_threads) == 1
+    assert check_threads[0] is not threading.main_thread()
+
+
 @pytest.mark.asyncio
 async def test_livez_alias(client: AsyncClient):
     response = await client.get("/livez")
@@ -166,6 +189,30 @@ async def test_livez_returns_503_when_queue_processor_failed(client: AsyncClient
         _queue_processor_failed.clear()
 
 
+@pytest.mark.asyncio
+async def test_livez_returns_503_when_model_warm_up_failed(client: AsyncClient):
+    _models_failed.set()
+    try:
+        response = await client.get("/livez")
+        assert response.status_code == 503
+        assert "Model warm-up failed" in response.json()["detail"]
+    finally:
+        _models_failed.clear()
+
+
+@pytest.mark.asyncio
+async def test_ready_returns_503_when_model_warm_up_failed(client: AsyncClient):
+    _models_ready.clear()
+    _models_failed.set()
+    try:
+        response = await client.get("/ready")
+        assert response.status_code == 503
+        assert "Model warm-up failed" in response.json()["detail"]
+    finally:
+        _models_failed.clear()
+        _models_ready.set()
+
+
 @pytest.mark.asyncio
 async def test_ready_returns_503_when_queue_processor_failed(client: AsyncClient):
     _queue_processor_failed.set()
@@ -177,6 +224,34 @@ async def test_ready_returns_503_when_queue_processor_failed(client: AsyncClient
         _queue_processor_failed.clear()
 
 
+@pytest.mark.asyncio
+async def test_warm_up_models_sets_ready():
+    orchestrator = MagicMock()
+    orchestrator.warm_up_caches = AsyncMock()
+    _models_ready.clear()
+    try:
+        await _warm_up_models(orchestrator)
+        assert _models_ready.is_set()
+        assert not _models_failed.is_set()
+        orchestrator.warm_up_caches.assert_awaited_once()
+    finally:
+        _models_ready.set()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_models_flags_failure():
+    orchestrator = MagicMock()
+    orchestrator.warm_up_caches = AsyncMock(side_effect=RuntimeError("no weights"))
+    _models_ready.clear()
+    try:
+        await _warm_up_models(orchestrator)
+        assert not _models_ready.is_set()
+        assert _models_failed.is_set()
+    finally:
+        _models_ready.set()
+        _models_failed.clear()
+
+
 def test_supervise_queue_processor_flags_on_exception():
     event = asyncio.Event()
     task = MagicMock()
@@ -0,0 +1,77 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from docling_jobkit.datamodel.task import Task
+from docling_jobkit.datamodel.task_meta import TaskStatus
+
+from docling_serve.app import _task_status_with_wait, create_app
+from docling_serve.settings import docling_serve_settings
+
+
+class FakeOrchestrator:
+    """Ignores ``wait`` like the local and RQ engines."""
+
+    def __init__(self, complete_after: int | None = None):
+        self.complete_after = complete_after
+        self.waits: list[float] = []
+
+    async def task_status(self, task_id: str, wait: float = 0.0) -> Task:
+        self.waits.append(wait)
+        task = Task(task_id=task_id)
+        if self.complete_after is not None and len(self.waits) >= self.complete_after:
+            task.set_status(TaskStatus.SUCCESS)
+        return task
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(docling_serve_settings, "sync_poll_interval", 0.01)
+
+
+async def test_returns_as_soon_as_task_completes():
+    orchestrator = FakeOrchestrator(complete_after=3)
+
+    start = time.monotonic()
+    task = await _task_status_with_wait(orchestrator, "t1", wait=10.0)  # type: ignore[arg-type]
+
+    assert task.is_completed()
+    assert len(orchestrator.waits) == 3
+    assert time.monotonic() - start < 1.0
+
+
+async def test_returns_pending_task_when_wait_expires():
+    orchestrator = FakeOrchestrator()
+
+    start = time.monotonic()
+    task = await _task_status_with_wait(orchestrator, "t1", wait=0.2)  # type: ignore[arg-type]
+    elapsed = time.monotonic() - start
+
+    assert not task.is_completed()
+    assert 0.2 <= elapsed < 1.0
+
+
+async def test_wait_is_capped_at_max_sync_wait(monkeypatch):
+    monkeypatch.setattr(docling_serve_settings, "max_sync_wait", 0.2)
+    orchestrator = FakeOrchestrator()
+
+    start = time.monotonic()
+    task = await _task_status_with_wait(orchestrator, "t1", wait=60.0)  # type: ignore[arg-type]
+    elapsed = time.monotonic() - start
+
+    assert not task.is_completed()
+    assert orchestrator.waits[0] == 0.2
+    assert elapsed < 1.0
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(create_app())
+
+
+@pytest.mark.parametrize("wait", ["nan", "inf", "-1"])
+def test_poll_rejects_non_finite_or_negative_wait(client: TestClient, wait: str):
+    response = client.get("/v1/status/poll/t1", params={"wait": wait})
+
+    assert response.status_code == 422
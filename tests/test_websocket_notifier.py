@@ -0,0 +1,62 @@
+import json
+
+from docling_jobkit.datamodel.task import Task
+from docling_jobkit.datamodel.task_meta import TaskStatus
+
+from docling_serve.websocket_notifier import WebsocketNotifier
+
+
+class FakeOrchestrator:
+    def __init__(self, tasks: dict[str, Task]):
+        self.tasks = tasks
+        self.status_calls: list[str] = []
+
+    async def task_status(self, task_id: str, wait: float = 0.0) -> Task:
+        self.status_calls.append(task_id)
+        return self.tasks[task_id]
+
+    async def get_queue_position(self, task_id: str) -> int:
+        return 1
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent: list[str] = []
+        self.closed = False
+
+    async def send_text(self, data: str):
+        self.sent.append(data)
+
+    async def close(self):
+        self.closed = True
+
+
+async def test_notify_skips_tasks_without_subscribers():
+    orchestrator = FakeOrchestrator({"t1": Task(task_id="t1")})
+    notifier = WebsocketNotifier(orchestrator)  # type: ignore[arg-type]
+    await notifier.add_task("t1")
+
+    await notifier.notify_task_subscribers("t1")
+    await notifier.notify_queue_positions()
+
+    assert orchestrator.status_calls == []
+
+
+async def test_notify_queue_positions_fetches_status_once():
+    orchestrator = FakeOrchestrator(
+        {
+            "pending": Task(task_id="pending"),
+            "started": Task(task_id="started", task_status=TaskStatus.STARTED),
+        }
+    )
+    notifier = WebsocketNotifier(orchestrator)  # type: ignore[arg-type]
+    pending_ws = FakeWebSocket()
+    started_ws = FakeWebSocket()
+    notifier.task_subscribers = {"pending": {pending_ws}, "started": {started_ws}}
+
+    await notifier.notify_queue_positions()
+
+    assert sorted(orchestrator.status_calls) == ["pending", "started"]
+    assert len(pending_ws.sent) == 1
+    assert json.loads(pending_ws.sent[0])["task"]["task_position"] == 1
+    assert started_ws.sent == []